@@ -5,203 +5,225 @@ These tests verify that resources work correctly with different path formats:
 - Relative paths with and without leading slashes
 - Paths with different separators
 - Edge cases and security validations
+
+Project trees are built through class-scoped tmp_path_factory fixtures, so
+the module can be distributed across workers with pytest-xdist (not a
+project dependency; install it separately):
+
+    pytest -n auto tests/services/test_resource_handlers.py
 """
+import asyncio
 import os
-import tempfile
+import re
 import pytest
 from pathlib import Path
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
+from typing import Mapping
 
+from code_index_mcp.server import mcp
 from code_index_mcp.services.file_service import FileService
-from code_index_mcp.services.project_management_service import ProjectManagementService
 
 
-def _create_test_context(base_path: str, settings=None):
+_TRAVERSAL_MSG_RE = re.compile(r"traversal|not allowed", re.I)
+
+
+class FakeLifespan:
+    """Lifespan context stand-in; mutable so ContextHelper.update_* writes land."""
+
+    __slots__ = ("base_path", "settings", "file_count", "index_manager")
+
+    def __init__(self, base_path, settings, file_count, index_manager):
+        self.base_path = base_path
+        self.settings = settings
+        self.file_count = file_count
+        self.index_manager = index_manager
+
+
+class _FakeCtx:
+    """Minimal stand-in for the MCP Context consumed by ContextHelper."""
+
+    __slots__ = ("request_context",)
+
+    def __init__(self, lifespan_context):
+        self.request_context = SimpleNamespace(lifespan_context=lifespan_context)
+
+
+def _create_test_context(base_path: str):
     """Create a mock MCP context for testing."""
-    if settings is None:
-        from code_index_mcp.project_settings import ProjectSettings
-        settings = ProjectSettings(base_path, skip_load=True)
-    
-    ctx = SimpleNamespace(
-        request_context=SimpleNamespace(
-            lifespan_context=SimpleNamespace(
-                base_path=base_path,
-                settings=settings,
-                file_count=0,
-                index_manager=None
-            )
-        )
-    )
-    return ctx
+    # FileService only reads base_path, so no ProjectSettings is needed
+    return _FakeCtx(FakeLifespan(
+        base_path=base_path,
+        settings=None,
+        file_count=0,
+        index_manager=None
+    ))
+
+
+# Fixture trees (relative path -> content), shared read-only across tests
+_FIXTURE_FILES = MappingProxyType({
+    # Root level file
+    "README.md": "# Project README\nThis is the main readme.",
+    # Nested file
+    "src/main.py": "def main():\n    print('Hello')\n",
+    # Deeply nested file
+    "src/utils/helper.py": "# Helper functions\ndef helper():\n    pass\n",
+    # File with special characters in name
+    "docs/file-with-dashes.txt": "Content with dashes",
+    # File with spaces (if supported)
+    "docs/file with spaces.txt": "Content with spaces",
+})
+
+_INTEGRATION_FILES = MappingProxyType({
+    "README.md": "# Test Project\n",
+    "src/main.py": "def main():\n    pass\n",
+    "src/__init__.py": "",
+    "tests/test_main.py": "def test_main():\n    assert True\n",
+    ".gitignore": "*.pyc\n__pycache__/\n",
+})
+
+# The same trees encoded once at import time, so setup writes raw bytes
+_FIXTURE_BYTES = MappingProxyType(
+    {rel_path: content.encode("utf-8") for rel_path, content in _FIXTURE_FILES.items()}
+)
+_INTEGRATION_BYTES = MappingProxyType(
+    {rel_path: content.encode("utf-8") for rel_path, content in _INTEGRATION_FILES.items()}
+)
+
+
+def _write_tree(base_path: str, files: Mapping[str, bytes]):
+    """Create each file in files (relative path -> bytes) under base_path."""
+    for rel_dir in {os.path.dirname(rel_path) for rel_path in files}:
+        os.makedirs(os.path.join(base_path, rel_dir), exist_ok=True)
+    for rel_path, data in files.items():
+        Path(base_path, rel_path).write_bytes(data)
+
+
+@pytest.fixture(scope="class")
+def file_service(tmp_path_factory):
+    """Create the path-format project tree and its FileService once per test class."""
+    temp_dir = str(tmp_path_factory.mktemp("path_formats"))
+    _write_tree(temp_dir, _FIXTURE_BYTES)
+    yield FileService(_create_test_context(temp_dir))
+
+
+@pytest.fixture(scope="session")
+def supports_unicode_fs(tmp_path_factory):
+    """Probe once whether the temp filesystem accepts unicode filenames."""
+    try:
+        (tmp_path_factory.mktemp("unicode_probe") / "файл").touch()
+    except (OSError, UnicodeError):
+        # Some systems might not support unicode filenames
+        return False
+    return True
+
+
+@pytest.fixture(scope="class")
+def normalization_project(tmp_path_factory):
+    """Create a project containing a single test file once per test class."""
+    temp_dir = str(tmp_path_factory.mktemp("normalization"))
+    _write_tree(temp_dir, {"test.txt": b"test content"})
+    yield temp_dir
+
+
+@pytest.fixture(scope="class")
+def integration_project(tmp_path_factory):
+    """Create a realistic project structure once per test class."""
+    temp_dir = str(tmp_path_factory.mktemp("integration"))
+    _write_tree(temp_dir, _INTEGRATION_BYTES)
+    yield temp_dir
+
+
+async def _list_mcp_catalog():
+    """Fetch both MCP resource listings within a single event loop."""
+    return await mcp.list_resources(), await mcp.list_resource_templates()
+
+
+@pytest.fixture(scope="module")
+def mcp_catalog():
+    """Run the MCP listing coroutines once per module."""
+    return asyncio.run(_list_mcp_catalog())
+
+
+@pytest.fixture(scope="module")
+def mcp_resources(mcp_catalog):
+    """Registered MCP resources, keyed by URI."""
+    return {str(r.uri): r for r in mcp_catalog[0]}
+
+
+@pytest.fixture(scope="module")
+def mcp_templates(mcp_catalog):
+    """Registered MCP resource templates, keyed by URI template."""
+    return {t.uriTemplate: t for t in mcp_catalog[1]}
 
 
 class TestFileResourcePathFormats:
     """Test files://{file_path} resource with various path formats."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Create a temporary directory structure
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_files = {}
-        
-        # Create test files in various locations
-        # Root level file
-        self._create_test_file("README.md", "# Project README\nThis is the main readme.")
-        
-        # Nested file
-        self._create_test_file("src/main.py", "def main():\n    print('Hello')\n")
-        
-        # Deeply nested file
-        self._create_test_file("src/utils/helper.py", "# Helper functions\ndef helper():\n    pass\n")
-        
-        # File with special characters in name
-        self._create_test_file("docs/file-with-dashes.txt", "Content with dashes")
-        
-        # File with spaces (if supported)
-        self._create_test_file("docs/file with spaces.txt", "Content with spaces")
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
-    def _create_test_file(self, rel_path: str, content: str):
-        """Create a test file with given content."""
-        full_path = os.path.join(self.temp_dir, rel_path)
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        self.test_files[rel_path] = content
-    
-    def _get_service(self):
-        """Get FileService instance with test context."""
-        ctx = _create_test_context(self.temp_dir)
-        return FileService(ctx)
-    
-    def test_simple_relative_path(self):
-        """Test reading file with simple relative path."""
-        service = self._get_service()
-        content = service.get_file_content("README.md")
-        assert content == self.test_files["README.md"]
-    
-    def test_relative_path_with_leading_slash(self):
-        """Test that leading slash in relative path is handled correctly."""
-        service = self._get_service()
+
+    @pytest.mark.parametrize("path,expected", [
+        ("README.md", _FIXTURE_FILES["README.md"]),
+        ("src/main.py", _FIXTURE_FILES["src/main.py"]),
+        ("src/utils/helper.py", _FIXTURE_FILES["src/utils/helper.py"]),
         # Leading slash should be stripped and treated as relative path
-        # This tests the common mistake users make
-        try:
-            content = service.get_file_content("/README.md")
-            # If it works, verify it's the right content
-            assert content == self.test_files["README.md"]
-        except ValueError as e:
-            # If it fails, ensure it's because of absolute path detection
-            assert "Absolute file paths" in str(e) or "not allowed" in str(e)
-    
-    def test_nested_relative_path(self):
-        """Test reading nested file with relative path."""
-        service = self._get_service()
-        content = service.get_file_content("src/main.py")
-        assert content == self.test_files["src/main.py"]
-    
-    def test_nested_path_with_forward_slash(self):
-        """Test nested path with forward slashes (Unix-style)."""
-        service = self._get_service()
-        content = service.get_file_content("src/utils/helper.py")
-        assert content == self.test_files["src/utils/helper.py"]
-    
-    def test_nested_path_with_backslash(self):
-        """Test nested path with backslashes (Windows-style)."""
-        service = self._get_service()
-        # Test with backslashes - should be normalized
-        content = service.get_file_content("src\\utils\\helper.py")
-        assert content == self.test_files["src/utils/helper.py"]
-    
-    def test_mixed_path_separators(self):
-        """Test path with mixed separators."""
-        service = self._get_service()
-        content = service.get_file_content("src/utils\\helper.py")
-        assert content == self.test_files["src/utils/helper.py"]
-    
-    def test_path_with_dot_notation(self):
-        """Test path with ./ prefix."""
-        service = self._get_service()
-        content = service.get_file_content("./README.md")
-        assert content == self.test_files["README.md"]
-    
-    def test_path_with_extra_slashes(self):
-        """Test path with extra slashes."""
-        service = self._get_service()
-        # Extra slashes should be normalized
-        content = service.get_file_content("src//utils//helper.py")
-        assert content == self.test_files["src/utils/helper.py"]
-    
-    def test_file_with_dashes_in_name(self):
-        """Test file with dashes in filename."""
-        service = self._get_service()
-        content = service.get_file_content("docs/file-with-dashes.txt")
-        assert content == self.test_files["docs/file-with-dashes.txt"]
-    
-    def test_file_with_spaces_in_name(self):
-        """Test file with spaces in filename."""
-        service = self._get_service()
-        content = service.get_file_content("docs/file with spaces.txt")
-        assert content == self.test_files["docs/file with spaces.txt"]
-    
-    def test_nonexistent_file(self):
+        # (a common mistake users make)
+        ("/README.md", _FIXTURE_FILES["README.md"]),
+        # Windows-style and mixed separators should be normalized
+        ("src\\main.py", _FIXTURE_FILES["src/main.py"]),
+        ("src\\utils\\helper.py", _FIXTURE_FILES["src/utils/helper.py"]),
+        ("src/utils\\helper.py", _FIXTURE_FILES["src/utils/helper.py"]),
+        ("./README.md", _FIXTURE_FILES["README.md"]),
+        ("src//utils//helper.py", _FIXTURE_FILES["src/utils/helper.py"]),
+        ("docs/file-with-dashes.txt", _FIXTURE_FILES["docs/file-with-dashes.txt"]),
+        ("docs/file with spaces.txt", _FIXTURE_FILES["docs/file with spaces.txt"]),
+    ])
+    def test_path_formats(self, file_service, path, expected):
+        """Test reading files with various relative path formats."""
+        assert file_service.get_file_content(path) == expected
+    
+    def test_nonexistent_file(self, file_service):
         """Test error handling for nonexistent file."""
-        service = self._get_service()
         with pytest.raises(FileNotFoundError):
-            service.get_file_content("nonexistent.py")
-    
-    def test_directory_traversal_attack_parent(self):
+            file_service.get_file_content("nonexistent.py")
+    
+    @pytest.mark.parametrize("path", [
+        "../../../etc/passwd",
+        # Traversal in the middle of the path
+        "src/../../../etc/passwd",
+        # Windows-style separators
+        "..\\..\\..\\windows\\system32",
+    ])
+    def test_directory_traversal_attack(self, file_service, path):
         """Test security: prevent directory traversal with ../ """
-        service = self._get_service()
-        with pytest.raises(ValueError) as exc_info:
-            service.get_file_content("../../../etc/passwd")
-        assert "traversal" in str(exc_info.value).lower() or "not allowed" in str(exc_info.value).lower()
-    
-    def test_directory_traversal_attack_mixed(self):
-        """Test security: prevent directory traversal in middle of path."""
-        service = self._get_service()
         with pytest.raises(ValueError) as exc_info:
-            service.get_file_content("src/../../../etc/passwd")
-        assert "traversal" in str(exc_info.value).lower() or "not allowed" in str(exc_info.value).lower()
+            file_service.get_file_content(path)
+        assert _TRAVERSAL_MSG_RE.search(str(exc_info.value))
     
-    def test_absolute_path_unix(self):
+    def test_absolute_path_unix(self, file_service):
         """Test that absolute Unix paths are handled (leading slash stripped)."""
-        service = self._get_service()
         # Leading slash is stripped, so /etc/passwd becomes etc/passwd
         # which will fail because the file doesn't exist, not because it's absolute
         with pytest.raises(FileNotFoundError):
-            service.get_file_content("/etc/passwd")
+            file_service.get_file_content("/etc/passwd")
     
-    def test_absolute_path_windows(self):
+    def test_absolute_path_windows(self, file_service):
         """Test that absolute Windows paths are rejected."""
-        service = self._get_service()
         with pytest.raises(ValueError) as exc_info:
-            service.get_file_content("C:\\Windows\\System32\\config\\sam")
+            file_service.get_file_content("C:\\Windows\\System32\\config\\sam")
         assert "Absolute file paths" in str(exc_info.value) or "not allowed" in str(exc_info.value)
     
-    def test_empty_path(self):
+    def test_empty_path(self, file_service):
         """Test that empty path is rejected."""
-        service = self._get_service()
         with pytest.raises(ValueError) as exc_info:
-            service.get_file_content("")
+            file_service.get_file_content("")
         assert "empty" in str(exc_info.value).lower() or "cannot be empty" in str(exc_info.value).lower()
     
     def test_no_project_setup(self):
         """Test error when project is not set up."""
-        ctx = SimpleNamespace(
-            request_context=SimpleNamespace(
-                lifespan_context=SimpleNamespace(
-                    base_path=None,
-                    settings=None,
-                    file_count=0,
-                    index_manager=None
-                )
-            )
-        )
+        ctx = _FakeCtx(FakeLifespan(
+            base_path=None,
+            settings=None,
+            file_count=0,
+            index_manager=None
+        ))
         service = FileService(ctx)
         with pytest.raises(ValueError) as exc_info:
             service.get_file_content("README.md")
@@ -210,93 +232,46 @@ class TestFileResourcePathFormats:
 class TestPathNormalization:
     """Test path normalization edge cases."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        # Create a simple test file
-        test_file = os.path.join(self.temp_dir, "test.txt")
-        with open(test_file, 'w') as f:
-            f.write("test content")
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
-    def test_path_with_current_dir_references(self):
+    def test_path_with_current_dir_references(self, normalization_project):
         """Test path with multiple ./ references."""
-        ctx = _create_test_context(self.temp_dir)
+        ctx = _create_test_context(normalization_project)
         service = FileService(ctx)
         
         content = service.get_file_content("././test.txt")
         assert content == "test content"
     
-    def test_unicode_in_path(self):
+    def test_unicode_in_path(self, tmp_path, supports_unicode_fs):
         """Test paths with unicode characters."""
-        # Create a file with unicode name
-        unicode_file = os.path.join(self.temp_dir, "файл.txt")
-        try:
-            with open(unicode_file, 'w', encoding='utf-8') as f:
-                f.write("unicode content")
-            
-            ctx = _create_test_context(self.temp_dir)
-            service = FileService(ctx)
-            
-            content = service.get_file_content("файл.txt")
-            assert content == "unicode content"
-        except (OSError, UnicodeError):
-            # Some systems might not support unicode filenames
+        if not supports_unicode_fs:
             pytest.skip("System doesn't support unicode filenames")
+        
+        # Create a file with unicode name outside the shared class tree
+        _write_tree(str(tmp_path), {"файл.txt": "unicode content".encode("utf-8")})
+        
+        ctx = _create_test_context(str(tmp_path))
+        service = FileService(ctx)
+        
+        content = service.get_file_content("файл.txt")
+        assert content == "unicode content"
 
 
 class TestResourceIntegration:
     """Integration tests for resource handlers."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-        # Create a realistic project structure
-        files = {
-            "README.md": "# Test Project\n",
-            "src/main.py": "def main():\n    pass\n",
-            "src/__init__.py": "",
-            "tests/test_main.py": "def test_main():\n    assert True\n",
-            ".gitignore": "*.pyc\n__pycache__/\n",
-        }
-        
-        for rel_path, content in files.items():
-            full_path = os.path.join(self.temp_dir, rel_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-    
-    def test_read_multiple_files_different_formats(self):
+    def test_read_multiple_files_different_formats(self, integration_project):
         """Test reading multiple files with different path formats."""
-        service = FileService(_create_test_context(self.temp_dir))
+        service = FileService(_create_test_context(integration_project))
         
         # Different ways to reference the same logical files
-        test_cases = [
-            ("README.md", "# Test Project\n"),
-            ("src/main.py", "def main():\n    pass\n"),
-            ("src/__init__.py", ""),
-            ("tests/test_main.py", "def test_main():\n    assert True\n"),
-        ]
+        paths = ["README.md", "src/main.py", "src/__init__.py", "tests/test_main.py"]
         
-        for path, expected_content in test_cases:
+        for path in paths:
             content = service.get_file_content(path)
-            assert content == expected_content, f"Failed for path: {path}"
+            assert content == _INTEGRATION_FILES[path], f"Failed for path: {path}"
     
-    def test_read_hidden_files(self):
+    def test_read_hidden_files(self, integration_project):
         """Test reading hidden files (starting with dot)."""
-        service = FileService(_create_test_context(self.temp_dir))
+        service = FileService(_create_test_context(integration_project))
         
         content = service.get_file_content(".gitignore")
         assert "*.pyc" in content
@@ -305,185 +280,24 @@ class TestResourceIntegration:
 class TestResourceListing:
     """Test MCP resource listing functionality."""
     
-    def test_list_resources_returns_config_resource(self):
-        """Test that list_resources returns the config resource."""
-        import asyncio
-        from code_index_mcp.server import mcp
-        
-        # Get list of resources
-        resources = asyncio.run(mcp.list_resources())
-        
-        # Should have at least the config resource
-        assert len(resources) > 0
-        
-        # Find config resource (uri is a pydantic AnyUrl object)
-        config_resources = [r for r in resources if str(r.uri) == "config://code-indexer"]
-        assert len(config_resources) == 1
-        
-        config_resource = config_resources[0]
-        assert str(config_resource.uri) == "config://code-indexer"
-        assert config_resource.name is not None or config_resource.uri is not None
-    
-    def test_list_resource_templates_returns_files_template(self):
-        """Test that list_resource_templates returns the files template."""
-        import asyncio
-        from code_index_mcp.server import mcp
-        
-        # Get list of resource templates
-        templates = asyncio.run(mcp.list_resource_templates())
-        
-        # Should have the files template
-        assert len(templates) > 0
-        
-        # Find files template
-        files_templates = [t for t in templates if "files://" in t.uriTemplate]
-        assert len(files_templates) == 1
-        
-        files_template = files_templates[0]
-        assert files_template.uriTemplate == "files://{file_path}"
-        assert files_template.name is not None or files_template.uriTemplate is not None
-    
-    def test_resources_are_discoverable(self):
-        """Test that both static and template resources are discoverable."""
-        import asyncio
-        from code_index_mcp.server import mcp
-        
-        # Get both lists
-        resources = asyncio.run(mcp.list_resources())
-        templates = asyncio.run(mcp.list_resource_templates())
-        
-        # Should have at least one of each
-        assert len(resources) >= 1, "Should have at least the config resource"
-        assert len(templates) >= 1, "Should have at least the files template"
-        
-        # Collect all URIs/templates (convert AnyUrl to string)
-        resource_uris = {str(r.uri) for r in resources}
-        template_uris = {t.uriTemplate for t in templates}
-        
-        # Verify expected resources
-        assert "config://code-indexer" in resource_uris
-        assert "files://{file_path}" in template_uris
-    
-    def test_config_resource_has_metadata(self):
-        """Test that config resource has proper metadata."""
-        import asyncio
-        from code_index_mcp.server import mcp
-        
-        resources = asyncio.run(mcp.list_resources())
-        config_resources = [r for r in resources if str(r.uri) == "config://code-indexer"]
-        
-        assert len(config_resources) == 1
-        config_resource = config_resources[0]
-        
-        # Check that it has some identifying information
-        assert str(config_resource.uri) == "config://code-indexer"
-        # At minimum, should have uri
-        assert hasattr(config_resource, 'uri')
-    
-    def test_files_template_has_metadata(self):
-        """Test that files template resource has proper metadata."""
-        import asyncio
-        from code_index_mcp.server import mcp
-        
-        templates = asyncio.run(mcp.list_resource_templates())
-        files_templates = [t for t in templates if "files://" in t.uriTemplate]
-        
-        assert len(files_templates) == 1
-        files_template = files_templates[0]
-        
-        # Check that it has proper template structure
-        assert files_template.uriTemplate == "files://{file_path}"
-        assert hasattr(files_template, 'uriTemplate')
-        
-        # Check if it has description or name (optional but good practice)
-        # Note: These might be None if not set in the decorator
-        assert files_template.uriTemplate is not None
-    
-    def test_read_resource_via_mcp_with_workspace_files(self):
-        """Test reading actual files from the workspace through MCP resources."""
-        import tempfile
-        import os
-        from types import SimpleNamespace
-        from code_index_mcp.services.file_service import FileService
-        from code_index_mcp.project_settings import ProjectSettings
-        
-        # Create a temporary workspace with test files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test files
-            readme_path = os.path.join(temp_dir, "README.md")
-            readme_content = "# Test Project\nThis is a test readme for MCP resources."
-            with open(readme_path, 'w') as f:
-                f.write(readme_content)
-            
-            src_dir = os.path.join(temp_dir, "src")
-            os.makedirs(src_dir)
-            main_path = os.path.join(src_dir, "main.py")
-            main_content = "def main():\n    print('Hello from MCP!')\n"
-            with open(main_path, 'w') as f:
-                f.write(main_content)
-            
-            nested_dir = os.path.join(src_dir, "utils")
-            os.makedirs(nested_dir)
-            helper_path = os.path.join(nested_dir, "helper.py")
-            helper_content = "# Helper utilities\ndef helper():\n    return 'help'\n"
-            with open(helper_path, 'w') as f:
-                f.write(helper_content)
-            
-            # Create context with the temp directory
-            settings = ProjectSettings(temp_dir, skip_load=True)
-            ctx = SimpleNamespace(
-                request_context=SimpleNamespace(
-                    lifespan_context=SimpleNamespace(
-                        base_path=temp_dir,
-                        settings=settings,
-                        file_count=0,
-                        index_manager=None
-                    )
-                )
-            )
-            
-            # Create FileService with this context
-            service = FileService(ctx)
-            
-            # Test reading README.md
-            content = service.get_file_content("README.md")
-            assert content == readme_content
-            
-            # Test reading nested file
-            content = service.get_file_content("src/main.py")
-            assert content == main_content
-            
-            # Test reading deeply nested file
-            content = service.get_file_content("src/utils/helper.py")
-            assert content == helper_content
-            
-            # Test with different path formats
-            content = service.get_file_content("./README.md")
-            assert content == readme_content
-            
-            # Test with leading slash (should be stripped)
-            content = service.get_file_content("/README.md")
-            assert content == readme_content
-            
-            # Test with backslashes (Windows-style)
-            content = service.get_file_content("src\\main.py")
-            assert content == main_content
-            
-            # Test with mixed separators
-            content = service.get_file_content("src/utils\\helper.py")
-            assert content == helper_content
-    
-    def test_config_resource_readable(self):
-        """Test that config resource can be listed and has correct URI format."""
-        import asyncio
-        from code_index_mcp.server import mcp
-        
-        resources = asyncio.run(mcp.list_resources())
-        config_resources = [r for r in resources if str(r.uri) == "config://code-indexer"]
-        
-        assert len(config_resources) == 1
-        
-        # Verify URI scheme is correct
-        uri_str = str(config_resources[0].uri)
-        assert uri_str.startswith("config://")
-        assert "code-indexer" in uri_str
+    def test_config_resource(self, mcp_catalog, mcp_resources):
+        """Test that the config resource is listed once with its metadata."""
+        # Should have exactly one config resource (the keyed view collapses duplicates)
+        raw_resources = mcp_catalog[0]
+        assert sum(str(r.uri) == "config://code-indexer" for r in raw_resources) == 1
+        
+        # Name and description come from the decorated handler
+        config_resource = mcp_resources["config://code-indexer"]
+        assert config_resource.name
+        assert config_resource.description
+    
+    def test_files_template(self, mcp_catalog, mcp_templates):
+        """Test that the files template is listed once with its metadata."""
+        # Should have exactly one files template (the keyed view collapses duplicates)
+        raw_templates = mcp_catalog[1]
+        assert sum("files://" in t.uriTemplate for t in raw_templates) == 1
+        
+        # Name and description come from the decorated handler
+        files_template = mcp_templates["files://{file_path}"]
+        assert files_template.name
+        assert files_template.description